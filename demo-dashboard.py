@@ -1,10 +1,12 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-from datetime import datetime
-import plotly.express as px
+import plotly.graph_objects as go
+import plotly.io as pio
+from plotly.subplots import make_subplots
 from PIL import Image
-import base64
+import os
+from collections import namedtuple
 
 # ---------------------------------------
 # PAGE CONFIGURATION
@@ -18,37 +20,32 @@ st.set_page_config(
 # ---------------------------------------
 # BACKGROUND IMAGE SETUP
 # ---------------------------------------
-def set_background(image_path: str):
+def set_background(image_url: str):
     """Apply a background image with a dark overlay."""
-    with open(image_path, "rb") as image:
-        encoded = base64.b64encode(image.read()).decode()
     st.markdown(f"""
         <style>
         .stApp {{
             background: linear-gradient(rgba(0,0,0,0.5), rgba(0,0,0,0.5)), 
-                        url('data:image/png;base64,{encoded}');
+                        url('{image_url}');
             background-size: cover;
             background-blend-mode: darken;
         }}
         </style>
     """, unsafe_allow_html=True)
 
-set_background('images/bg.png')
+set_background('app/static/bg.png')
 
 # ---------------------------------------
 # HEADER SECTION
 # ---------------------------------------
 def header_section():
-    logo_bytes = open("images/logo.png", "rb").read()
-    logo_base64 = base64.b64encode(logo_bytes).decode()
-
     header = st.container()
     with header:
         col_yellow = st.columns([1])[0]
         with col_yellow:
-            st.markdown(f"""
+            st.markdown("""
                 <div style='height:72px; width:100%; background-color:#FFD900; display:flex; align-items:center;'>
-                    <img src='data:image/png;base64,{logo_base64}' height='56' style='margin-left:0; margin-right:16px;'>
+                    <img src='app/static/logo.png' height='56' style='margin-left:0; margin-right:16px;'>
                     <span style='font-size:24px; font-weight:bold; color:#3F58A6; vertical-align:middle;'>
                         Service Ticket Dashboard
                     </span>
@@ -61,47 +58,132 @@ st.markdown("<div style='height:24px;'></div>", unsafe_allow_html=True)
 # ---------------------------------------
 # LOAD DATA
 # ---------------------------------------
+CSV_PATH = 'service_ticket_details.csv'
+PARQUET_PATH = 'service_ticket_details.parquet'
+ACTIVE_STATUSES = ('Open', 'In Progress', 'On Hold')
+
+TicketData = namedtuple('TicketData', ['df', 'categories', 'priorities', 'statuses', 'min_date', 'max_date'])
+
+def category_mask(column, values):
+    """Boolean mask of rows whose categorical value is in `values`, compared on integer codes."""
+    wanted = column.cat.categories.get_indexer(list(values))
+    return np.isin(column.cat.codes.to_numpy(), wanted[wanted >= 0])
+
+def category_counts(column):
+    """Rows per category via np.bincount on the codes, largest first; empty categories are dropped."""
+    codes = column.cat.codes.to_numpy()
+    counts = np.bincount(codes[codes >= 0], minlength=len(column.cat.categories))
+    return pd.Series(counts, index=column.cat.categories)[counts > 0].sort_values(ascending=False)
+
+def read_tickets():
+    """Read the ticket table, preferring an up-to-date Parquet copy of the CSV."""
+    if os.path.exists(PARQUET_PATH) and os.path.getmtime(PARQUET_PATH) >= os.path.getmtime(CSV_PATH):
+        return pd.read_parquet(PARQUET_PATH, engine='pyarrow')
+    df = pd.read_csv(
+        CSV_PATH,
+        engine='pyarrow',
+        parse_dates=['CreatedDate', 'ClosedDate'],
+        dtype={'Category': 'category', 'Priority': 'category', 'Status': 'category'},
+    )
+    try:
+        df.to_parquet(PARQUET_PATH, engine='pyarrow')
+    except OSError:
+        pass  # Read-only checkout: keep serving from the CSV
+    return df
+
 @st.cache_data
 def load_data():
-    df = pd.read_csv('service_ticket_details.csv')
-    df['CreatedDate'] = pd.to_datetime(df['CreatedDate'])
-    df['ClosedDate'] = pd.to_datetime(df['ClosedDate'], errors='coerce')
-    return df
+    df = read_tickets()
+    # Arrow hands back second/millisecond resolution; the filters work in nanoseconds
+    df['CreatedDate'] = df['CreatedDate'].astype('datetime64[ns]')
+    df['ClosedDate'] = df['ClosedDate'].astype('datetime64[ns]')
+    # Time-frame keys are derived once here so reruns only group, never re-convert
+    df['period_D'] = df['CreatedDate'].dt.normalize()
+    df['period_M'] = df['CreatedDate'].dt.to_period('M')
+    df['period_Q'] = df['CreatedDate'].dt.to_period('Q')
+    df['period_Y'] = df['CreatedDate'].dt.year
+    # Status buckets are fixed per ticket, so the metrics and time series share these masks
+    df['is_active'] = category_mask(df['Status'], ACTIVE_STATUSES)
+    df['is_closed'] = category_mask(df['Status'], ('Closed',))
+    # Filter options and date bounds are fixed per load, so the sidebar reads them from here
+    return TicketData(
+        df,
+        df['Category'].cat.categories.tolist(),
+        df['Priority'].cat.categories.tolist(),
+        df['Status'].cat.categories.tolist(),
+        df['CreatedDate'].min().date(),
+        df['CreatedDate'].max().date(),
+    )
+
+@st.cache_data
+def default_filter_key():
+    """Filter tuple the sidebar starts with: full date range and every option selected."""
+    data = load_data()
+    return (
+        data.min_date,
+        data.max_date,
+        tuple(sorted(data.categories)),
+        tuple(sorted(data.priorities)),
+        tuple(sorted(data.statuses)),
+    )
 
-df = load_data()
+data = load_data()
+df = data.df
 
 # ---------------------------------------
 # FILTERS (Always Active)
 # ---------------------------------------
 with st.sidebar:
     st.title("⚙️ Filters")
-    min_date, max_date = df['CreatedDate'].min().date(), df['CreatedDate'].max().date()
+    min_date, max_date = data.min_date, data.max_date
     start_date = st.date_input("Start date", min_value=min_date, max_value=max_date, value=min_date)
     end_date = st.date_input("End date", min_value=min_date, max_value=max_date, value=max_date)
 
-    category = st.multiselect('Category', options=df['Category'].unique(), default=df['Category'].unique())
-    priority = st.multiselect('Priority', options=df['Priority'].unique(), default=df['Priority'].unique())
-    status = st.multiselect('Status', options=df['Status'].unique(), default=df['Status'].unique())
+    category = st.multiselect('Category', options=data.categories, default=data.categories)
+    priority = st.multiselect('Priority', options=data.priorities, default=data.priorities)
+    status = st.multiselect('Status', options=data.statuses, default=data.statuses)
     time_frame = st.selectbox("Time frame", ("Monthly","Daily", "Quarterly", "Yearly"))
 
 # ---------------------------------------
 # FILTER DATA
 # ---------------------------------------
-filtered_df = df[
-    (df['CreatedDate'].dt.date >= start_date) &
-    (df['CreatedDate'].dt.date <= end_date) &
-    (df['Category'].isin(category)) &
-    (df['Priority'].isin(priority)) &
-    (df['Status'].isin(status))
-]
+@st.cache_data
+def get_filtered(start_date, end_date, category, priority, status):
+    """Return the tickets matching the sidebar filters (memoized per filter tuple)."""
+    df = load_data().df
+    if (start_date, end_date, category, priority, status) == default_filter_key():
+        return df
+    # Compare raw datetime64 values against day bounds instead of building per-row date objects
+    start_ts = pd.Timestamp(start_date)
+    end_ts = pd.Timestamp(end_date) + pd.Timedelta(days=1)
+    dates = df['CreatedDate'].values
+    conds = [
+        dates >= start_ts.to_datetime64(),
+        dates < end_ts.to_datetime64(),
+        category_mask(df['Category'], category),
+        category_mask(df['Priority'], priority),
+        category_mask(df['Status'], status),
+    ]
+    # AND everything into a single buffer, then take rows by position
+    mask = conds[0]
+    for cond in conds[1:]:
+        np.logical_and(mask, cond, out=mask)
+    return df.iloc[np.flatnonzero(mask)]
+
+# Sorted tuples keep the cache key hashable and independent of selection order
+filter_key = (start_date, end_date, tuple(sorted(category)), tuple(sorted(priority)), tuple(sorted(status)))
+filtered_df = get_filtered(*filter_key)
 
 # ---------------------------------------
 # METRICS CALCULATION
 # ---------------------------------------
 total_tickets = len(filtered_df)
-active_tickets = filtered_df[filtered_df['Status'].isin(['Open', 'In Progress', 'On Hold'])].shape[0]
-new_tickets = filtered_df[filtered_df['CreatedDate'] > (datetime.now() - pd.Timedelta(days=30))].shape[0]
-closed_tickets = filtered_df[filtered_df['Status'] == 'Closed'].shape[0]
+active_tickets = int(filtered_df['is_active'].sum())
+# Compare the raw int64 nanosecond view against a cutoff computed once per run
+cutoff_ns = (pd.Timestamp.now() - pd.Timedelta(days=30)).value
+created_ns = filtered_df['CreatedDate'].values.view('i8')
+new_tickets = int((created_ns > cutoff_ns).sum())
+closed_tickets = int(filtered_df['is_closed'].sum())
 closure_rate = (closed_tickets / total_tickets * 100) if total_tickets > 0 else 0
 
 # ---------------------------------------
@@ -119,49 +201,116 @@ chart_layout = dict(
 CHART_COLORS = ['#3F58A6', '#97934F', '#C19F62', '#FFD900']
 YELLOW_SHADES = ['#FFD900', '#FFE34D', '#FFEB80', '#FFF3B3', '#FFF9CC', '#FFFDE6']
 
+# ---------------------------------------
+# AGGREGATES
+# ---------------------------------------
+# Time frame -> precomputed key column from load_data
+FREQ_COL = {
+    'Daily': 'period_D',
+    'Monthly': 'period_M',
+    'Quarterly': 'period_Q',
+    'Yearly': 'period_Y',
+}
+
+def format_time_labels(keys, freq_label):
+    """Turn grouped time keys into axis labels; only runs on the grouped output."""
+    if freq_label == "Daily":
+        return keys.dt.date
+    elif freq_label == "Monthly":
+        return keys.dt.strftime('%b %Y')
+    return keys.astype(str)
+
+@st.cache_data
+def get_aggregates(start_date, end_date, category, priority, status, time_frame):
+    """Return the donut counts and time-grouped totals for a filter tuple."""
+    df = get_filtered(start_date, end_date, category, priority, status)
+    cat_counts = category_counts(df['Category'])
+    pri_counts = category_counts(df['Priority'])
+    stat_counts = category_counts(df['Status'])
+
+    time_key = df[FREQ_COL[time_frame]]
+    # value_counts on the key avoids building a groupby object; only the non-empty groups are sorted
+    total = time_key.value_counts(sort=False).sort_index()
+    active = time_key[df['is_active'].to_numpy()].value_counts(sort=False)
+    closed = time_key[df['is_closed'].to_numpy()].value_counts(sort=False)
+    grouped = pd.DataFrame({
+        'Total Tickets': total,
+        'Active Tickets': active.reindex(total.index, fill_value=0),
+        'Closed Tickets': closed.reindex(total.index, fill_value=0),
+    }).rename_axis('TimeGroup').reset_index()
+    grouped['TimeGroup'] = format_time_labels(grouped['TimeGroup'], time_frame)
+    return cat_counts, pri_counts, stat_counts, grouped
+
+cat_counts, pri_counts, stat_counts, grouped = get_aggregates(*filter_key, time_frame)
+
 # ---------------------------------------
 # DONUT CHARTS
 # ---------------------------------------
-def create_donut(df, column, title):
-    counts = df[column].value_counts().reset_index()
-    counts.columns = [column, 'Count']
-    fig = px.pie(counts, names=column, values='Count', title=title, hole=0.5,
-                 color_discrete_sequence=CHART_COLORS)
+@st.cache_data
+def donuts_json(donuts):
+    """Build all donuts as one subplot figure from (title, (label, count) pairs) and return its JSON."""
+    fig = make_subplots(rows=1, cols=len(donuts), specs=[[{'type': 'domain'}] * len(donuts)],
+                        subplot_titles=[title for title, _ in donuts])
+    for i, (title, counts) in enumerate(donuts, start=1):
+        labels, values = zip(*counts) if counts else ((), ())
+        # Each donut cycles CHART_COLORS on its own and gets its own titled legend group
+        colors = [CHART_COLORS[j % len(CHART_COLORS)] for j in range(len(labels))]
+        fig.add_trace(go.Pie(labels=labels, values=values, hole=0.5, name=title, sort=False,
+                             marker=dict(colors=colors),
+                             legendgroup=title, legendgrouptitle_text=title), row=1, col=i)
     fig.update_layout(**chart_layout)
-    return fig
+    return fig.to_json()
 
-category_donut = create_donut(filtered_df, 'Category', 'Tickets by Category')
-priority_donut = create_donut(filtered_df, 'Priority', 'Tickets by Priority')
-status_donut = create_donut(filtered_df, 'Status', 'Tickets by Status')
+donut_fig = pio.from_json(donuts_json((
+    ('Tickets by Category', tuple(cat_counts.items())),
+    ('Tickets by Status', tuple(stat_counts.items())),
+    ('Tickets by Priority', tuple(pri_counts.items())),
+)))
 
 # ---------------------------------------
 # TIME SERIES CHARTS
 # ---------------------------------------
-def group_time(df, freq_label):
-    df_time = df.copy()
-    if freq_label == "Daily":
-        df_time['TimeGroup'] = df_time['CreatedDate'].dt.date
-    elif freq_label == "Monthly":
-        df_time['TimeGroup'] = df_time['CreatedDate'].dt.to_period('M').dt.strftime('%b %Y')
-    elif freq_label == "Quarterly":
-        df_time['TimeGroup'] = df_time['CreatedDate'].dt.to_period('Q').astype(str)
-    else:
-        df_time['TimeGroup'] = df_time['CreatedDate'].dt.year.astype(str)
-    return df_time
-
-df_time = group_time(filtered_df, time_frame)
-grouped_total = df_time.groupby('TimeGroup').size().reset_index(name='Total Tickets')
-grouped_active = df_time[df_time['Status'].isin(['Open', 'In Progress', 'On Hold'])].groupby('TimeGroup').size().reset_index(name='Active Tickets')
-grouped_closed = df_time[df_time['Status'] == 'Closed'].groupby('TimeGroup').size().reset_index(name='Closed Tickets')
-
-def create_line_chart(df, y_col, title):
-    fig = px.line(df, x='TimeGroup', y=y_col, title=title, markers=True, color_discrete_sequence=YELLOW_SHADES)
+MAX_LINE_POINTS = 2000
+
+def lttb_indices(y, n_out):
+    """Largest-Triangle-Three-Buckets: pick `n_out` row positions that preserve the shape of `y`."""
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    y = np.asarray(y, dtype=float)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    picked = np.empty(n_out, dtype=int)
+    picked[0], picked[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = (end + next_end - 1) / 2
+        avg_y = y[end:next_end].mean()
+        xs = np.arange(start, end)
+        area = np.abs((a - avg_x) * (y[start:end] - y[a]) - (a - xs) * (avg_y - y[a]))
+        a = start + int(area.argmax())
+        picked[i + 1] = a
+    return picked
+
+def create_line_charts(grouped, time_frame):
+    series = ['Total Tickets', 'Active Tickets', 'Closed Tickets']
+    fig = make_subplots(rows=1, cols=len(series), subplot_titles=[f'{y_col} ({time_frame})' for y_col in series])
+    for i, y_col in enumerate(series, start=1):
+        df = grouped
+        if len(df) > MAX_LINE_POINTS:
+            df = df.iloc[lttb_indices(df[y_col].to_numpy(), MAX_LINE_POINTS)]
+        # WebGL trace and unified hover keep large series responsive
+        fig.add_trace(go.Scattergl(x=df['TimeGroup'], y=df[y_col], mode='lines+markers',
+                                   name=y_col, line=dict(color=YELLOW_SHADES[0])), row=1, col=i)
+        fig.update_yaxes(title_text=y_col, row=1, col=i)
     fig.update_layout(**chart_layout)
+    fig.update_layout(hovermode='x unified', spikedistance=0, showlegend=False)
+    fig.update_xaxes(**chart_layout['xaxis'], title_text='TimeGroup', showspikes=False)
+    fig.update_yaxes(**chart_layout['yaxis'])
     return fig
 
-total_line_fig = create_line_chart(grouped_total, 'Total Tickets', f'Total Tickets ({time_frame})')
-active_line_fig = create_line_chart(grouped_active, 'Active Tickets', f'Active Tickets ({time_frame})')
-closed_line_fig = create_line_chart(grouped_closed, 'Closed Tickets', f'Closed Tickets ({time_frame})')
+line_fig = create_line_charts(grouped, time_frame)
 
 # ---------------------------------------
 # DASHBOARD LAYOUT
@@ -206,19 +355,13 @@ st.markdown('---')
 
 row2_left, row2_center, row2_right = st.columns([1, 20, 1])
 with row2_center:
-    colA, colB, colC = st.columns(3)
-    colA.plotly_chart(category_donut, use_container_width=True)
-    colB.plotly_chart(status_donut, use_container_width=True)
-    colC.plotly_chart(priority_donut, use_container_width=True)
+    st.plotly_chart(donut_fig, use_container_width=True)
 
 st.markdown('---')
 
 row3_left, row3_center, row3_right = st.columns([1, 20, 1])
 with row3_center:
-    colD, colE, colF = st.columns(3)
-    colD.plotly_chart(total_line_fig, use_container_width=True)
-    colE.plotly_chart(active_line_fig, use_container_width=True)
-    colF.plotly_chart(closed_line_fig, use_container_width=True)
+    st.plotly_chart(line_fig, use_container_width=True)
 
 # ---------------------------------------
 # GLOBAL CSS (DARK THEME TEXT)